@@ -0,0 +1,27 @@
+"""add membership chat/role/joined_at index
+
+Revision ID: 3b7d2e9c4a1f
+Revises: f2ac16f31a9f
+Create Date: 2026-10-16 10:12:41.227904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d2e9c4a1f'
+down_revision: Union[str, None] = 'f2ac16f31a9f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # INCLUDE user_id so the first-admin lookup is answered from the index alone
+    op.create_index('ix_membership_chat_role_joined', 'membership', ['chat_id', 'role', 'joined_at'], unique=False, postgresql_include=['user_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_membership_chat_role_joined', table_name='membership')
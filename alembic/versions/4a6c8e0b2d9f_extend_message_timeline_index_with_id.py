@@ -0,0 +1,30 @@
+"""extend message timeline index with id for keyset paging
+
+Revision ID: 4a6c8e0b2d9f
+Revises: e2b7c9d3f5a8
+Create Date: 2026-10-16 12:14:39.770251
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a6c8e0b2d9f'
+down_revision: Union[str, None] = 'e2b7c9d3f5a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (chat_id, created_at, id) serves everything the old index did, plus the
+    # (created_at, id) row comparison used by keyset pagination
+    op.create_index('ix_message_chat_created_id', 'message', ['chat_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_message_chat_created', table_name='message')
+
+
+def downgrade() -> None:
+    op.create_index('ix_message_chat_created', 'message', ['chat_id', 'created_at'], unique=False)
+    op.drop_index('ix_message_chat_created_id', table_name='message')
@@ -0,0 +1,33 @@
+"""add covering membership indexes
+
+Revision ID: 7b3f9d1e6a24
+Revises: 4a6c8e0b2d9f
+Create Date: 2026-10-16 06:36:12.418903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3f9d1e6a24'
+down_revision: Union[str, None] = '4a6c8e0b2d9f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (user_id, chat_id) answers "my chats" from the index alone and still
+    # serves every lookup the single-column index did
+    op.create_index('ix_membership_user_chat', 'membership', ['user_id', 'chat_id'], unique=False)
+    op.drop_index('ix_membership_user_id', table_name='membership')
+    # Member listing filters on chat_id, sorts on joined_at and reads user_id/role
+    op.create_index('ix_membership_chat_joined', 'membership', ['chat_id', 'joined_at'], unique=False, postgresql_include=['user_id', 'role'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_membership_chat_joined', table_name='membership')
+    op.create_index('ix_membership_user_id', 'membership', ['user_id'], unique=False)
+    op.drop_index('ix_membership_user_chat', table_name='membership')
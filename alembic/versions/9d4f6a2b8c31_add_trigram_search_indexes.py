@@ -0,0 +1,30 @@
+"""add trigram search indexes
+
+Revision ID: 9d4f6a2b8c31
+Revises: 3b7d2e9c4a1f
+Create Date: 2026-10-16 11:03:17.584210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f6a2b8c31'
+down_revision: Union[str, None] = '3b7d2e9c4a1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm lets GIN indexes serve ILIKE '%...%' searches
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_message_content_trgm', 'message', ['content'], unique=False, postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'})
+    op.create_index('ix_user_username_trgm', 'user', ['username'], unique=False, postgresql_using='gin', postgresql_ops={'username': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_username_trgm', table_name='user')
+    op.drop_index('ix_message_content_trgm', table_name='message')
@@ -0,0 +1,27 @@
+"""add message content full-text index
+
+Revision ID: c5e8a1f4d7b2
+Revises: 9d4f6a2b8c31
+Create Date: 2026-10-16 11:26:52.903144
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8a1f4d7b2'
+down_revision: Union[str, None] = '9d4f6a2b8c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Queries must use the same to_tsvector('english', content) expression
+    op.create_index('ix_message_content_fts', 'message', [sa.text("to_tsvector('english', content)")], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_message_content_fts', table_name='message')
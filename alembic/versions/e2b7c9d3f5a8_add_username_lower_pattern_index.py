@@ -0,0 +1,27 @@
+"""add lower(username) text_pattern_ops index
+
+Revision ID: e2b7c9d3f5a8
+Revises: c5e8a1f4d7b2
+Create Date: 2026-10-16 11:48:05.316427
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c9d3f5a8'
+down_revision: Union[str, None] = 'c5e8a1f4d7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves case-insensitive prefix search: lower(username) LIKE 'abc%'
+    op.execute('CREATE INDEX ix_user_username_lower_pattern ON "user" (lower(username) text_pattern_ops)')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_username_lower_pattern', table_name='user')
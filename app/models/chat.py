@@ -54,11 +54,15 @@ class DirectMessage(Chat):
         min_id, max_id = sorted([str(user1_id), str(user2_id)])
         return f"{min_id}::{max_id}"
 
+    @classmethod
+    def find_by_dm_key(cls, session, dm_key: str):
+        """Find existing DM by its dm_key (unique index lookup)."""
+        return session.query(cls).filter_by(dm_key=dm_key).one_or_none()
+
     @classmethod
     def find_by_users(cls, session, user1_id: uuid.UUID, user2_id: uuid.UUID):
         """Find existing DM between two users."""
-        dm_key = cls.create_dm_key(user1_id, user2_id)
-        return session.query(cls).filter_by(dm_key=dm_key).first()
+        return cls.find_by_dm_key(session, cls.create_dm_key(user1_id, user2_id))
 
     def __repr__(self):
         return f"<DirectMessage(id={self.id}, dm_key='{self.dm_key}')>"
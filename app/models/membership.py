@@ -46,7 +46,20 @@ class Membership(Base):
 
     __table_args__ = (
         UniqueConstraint("chat_id", "user_id", name="membership_chat_user_unique"),
-        Index("ix_membership_user_id", "user_id"),  # For "my chats" lookup
+        Index("ix_membership_user_chat", "user_id", "chat_id"),  # For "my chats" lookup
+        Index(
+            "ix_membership_chat_role_joined",
+            "chat_id",
+            "role",
+            "joined_at",
+            postgresql_include=["user_id"],
+        ),  # For "first admin" lookup
+        Index(
+            "ix_membership_chat_joined",
+            "chat_id",
+            "joined_at",
+            postgresql_include=["user_id", "role"],
+        ),  # For member listing in join order
     )
 
     def __repr__(self):
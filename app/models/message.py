@@ -30,8 +30,15 @@ class Message(Base):
     sender = relationship("User", back_populates="sent_messages")
 
     __table_args__ = (
-        Index("ix_message_chat_created", "chat_id", "created_at"),  # Timeline paging
+        Index(
+            "ix_message_chat_created_id", "chat_id", "created_at", "id"
+        ),  # Timeline + keyset paging
         Index("ix_message_sender_created", "sender_id", "created_at"),  # Audit queries
+        Index(
+            "ix_message_content_fts",
+            func.to_tsvector("english", content),
+            postgresql_using="gin",
+        ),  # Full-text search; queries must use the same expression
     )
 
     def __repr__(self):
@@ -4,7 +4,7 @@ import enum
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import TIMESTAMP, Column, Enum, String, func
+from sqlalchemy import TIMESTAMP, Column, Enum, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -33,5 +33,13 @@ class User(Base):
     memberships = relationship("Membership", back_populates="user")
     sent_messages = relationship("Message", back_populates="sender")
 
+    __table_args__ = (
+        Index(
+            "ix_user_username_lower_pattern",
+            func.lower(username).label("username_lower"),
+            postgresql_ops={"username_lower": "text_pattern_ops"},
+        ),  # Case-insensitive prefix search: lower(username) LIKE 'abc%'
+    )
+
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', status={self.status})>"
@@ -1,13 +1,15 @@
 """Repository layer for data access."""
 
-from .chat_repo import ChatRepo
+from .chat_repo import ChatRepo, MemberRow
 from .message_repo import MessageRepo
-from .transaction import transaction_scope
+from .transaction import savepoint_scope, transaction_scope
 from .user_repo import UserRepo
 
 __all__ = [
     "UserRepo",
     "ChatRepo",
     "MessageRepo",
+    "MemberRow",
     "transaction_scope",
+    "savepoint_scope",
 ]
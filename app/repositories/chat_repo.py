@@ -1,8 +1,12 @@
 """Chat repository."""
 
-from typing import List, Optional, cast
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
 from uuid import UUID
 
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.logging.logging import get_logger
@@ -13,6 +17,31 @@ from app.repositories.base_repo import BaseRepo
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class MemberRow:
+    """Lightweight read-only view of a membership row."""
+
+    user_id: UUID
+    role: MemberRole
+    joined_at: datetime
+
+
+# SQLSTATE for foreign_key_violation
+_FOREIGN_KEY_VIOLATION = "23503"
+
+
+def _flush_new_chat(session: Session) -> None:
+    """Flush a new chat and its memberships, reporting unknown users clearly."""
+    # The membership FK on user.id validates member IDs as part of the insert,
+    # so no separate existence query is needed
+    try:
+        session.flush()
+    except IntegrityError as e:
+        if getattr(e.orig, "pgcode", None) == _FOREIGN_KEY_VIOLATION:
+            raise ValueError("One or more users do not exist") from e
+        raise
+
+
 class ChatRepo(BaseRepo):
     """Chat repository."""
 
@@ -27,31 +56,29 @@ class ChatRepo(BaseRepo):
             logger.warning(f"Attempted to create DM with same user: {user1_id}")
             raise ValueError("Cannot create direct message with the same user")
 
-        # Check if DM already exists
+        # Check if DM already exists; dm_key is used for both lookup and insert
+        dm_key = DirectMessage.create_dm_key(user1_id, user2_id)
         existing_dm = cast(
             Optional[DirectMessage],
-            DirectMessage.find_by_users(session, user1_id, user2_id),
+            DirectMessage.find_by_dm_key(session, dm_key),
         )
         if existing_dm:
             logger.debug(f"Returning existing DM: {existing_dm.id}")
             return existing_dm
 
         # Create new DM with memberships
-        dm_key = DirectMessage.create_dm_key(user1_id, user2_id)
         dm = DirectMessage(dm_key=dm_key)
-        session.add(dm)
-        session.flush()  # Generate ID
 
-        # Add both users as members
-        membership1 = Membership(
-            chat_id=dm.id, user_id=user1_id, role=MemberRole.MEMBER
+        # Link memberships through the relationship so a single flush inserts
+        # the chat first and fills in chat_id for both members
+        session.add_all(
+            [
+                dm,
+                Membership(chat=dm, user_id=user1_id, role=MemberRole.MEMBER),
+                Membership(chat=dm, user_id=user2_id, role=MemberRole.MEMBER),
+            ]
         )
-        membership2 = Membership(
-            chat_id=dm.id, user_id=user2_id, role=MemberRole.MEMBER
-        )
-        session.add(membership1)
-        session.add(membership2)
-        session.flush()
+        _flush_new_chat(session)
 
         logger.info(
             f"Created direct message: {dm.id} between {user1_id} and {user2_id}"
@@ -74,40 +101,40 @@ class ChatRepo(BaseRepo):
         )
 
     def _create_group_chat_implementation(
-        self, session: Session, creator_id: UUID, topic: str, member_ids: List[UUID]
+        self,
+        session: Session,
+        creator_id: UUID,
+        topic: str,
+        member_ids: Iterable[UUID],
     ) -> GroupChat:
         """Implementation of group chat creation."""
-        # Ensure creator is included in member list
-        all_member_ids = set(member_ids)
-        all_member_ids.add(creator_id)
+        # Dedupe in one pass and exclude creator so it isn't added twice
+        other_member_ids = set(member_ids)
+        other_member_ids.discard(creator_id)
 
         # Create group chat
         group = GroupChat(topic=topic)
-        session.add(group)
-        session.flush()  # Generate ID
 
-        # Add creator as admin
-        creator_membership = Membership(
-            chat_id=group.id, user_id=creator_id, role=MemberRole.ADMIN
+        # Add creator as admin, everyone else as member; linked through the
+        # relationship so one flush writes the chat and its memberships
+        session.add_all(
+            [
+                group,
+                Membership(chat=group, user_id=creator_id, role=MemberRole.ADMIN),
+                *(
+                    Membership(chat=group, user_id=member_id, role=MemberRole.MEMBER)
+                    for member_id in other_member_ids
+                ),
+            ]
         )
-        session.add(creator_membership)
-
-        # Add other members (excluding creator to avoid duplicate)
-        for member_id in all_member_ids:
-            if member_id != creator_id:
-                membership = Membership(
-                    chat_id=group.id, user_id=member_id, role=MemberRole.MEMBER
-                )
-                session.add(membership)
-
-        session.flush()
+        _flush_new_chat(session)
         return group
 
     def create_group_chat(
         self,
         creator_id: UUID,
         topic: str,
-        member_ids: List[UUID],
+        member_ids: Iterable[UUID],
         session: Optional[Session] = None,
     ) -> GroupChat:
         """Create a group chat with members."""
@@ -150,6 +177,38 @@ class ChatRepo(BaseRepo):
             ),
         )
 
+    def _get_user_chat_summaries_implementation(
+        self, session: Session, user_id: UUID
+    ) -> List[Tuple[UUID, str, datetime]]:
+        """Implementation of user chat summaries retrieval."""
+        return cast(
+            List[Tuple[UUID, str, datetime]],
+            (
+                session.query(Chat.id, Chat.type, Chat.created_at)
+                .join(Membership, Membership.chat_id == Chat.id)
+                .filter(Membership.user_id == user_id)
+                .order_by(Chat.created_at.desc())
+                .all()
+            ),
+        )
+
+    def get_user_chat_summaries(
+        self, user_id: UUID, session: Optional[Session] = None
+    ) -> List[Tuple[UUID, str, datetime]]:
+        """Get (id, type, created_at) of every chat a user is a member of.
+
+        Selects the columns directly instead of loading Chat objects, for
+        listings that do not need the ORM entities.
+        """
+        return cast(
+            List[Tuple[UUID, str, datetime]],
+            self._execute_with_session(
+                lambda s: self._get_user_chat_summaries_implementation(s, user_id),
+                session=session,
+                operation_name="get_user_chat_summaries",
+            ),
+        )
+
     def _add_member_implementation(
         self, session: Session, chat_id: UUID, user_id: UUID, role: MemberRole
     ) -> Membership:
@@ -163,7 +222,7 @@ class ChatRepo(BaseRepo):
 
         if existing:
             # Update role if different
-            if existing.role != role:
+            if existing.role is not role:
                 existing.role = role  # type: ignore[assignment]
                 session.flush()
             return existing
@@ -233,13 +292,39 @@ class ChatRepo(BaseRepo):
             ),
         )
 
+    def _is_member_of_implementation(
+        self, session: Session, chat_ids: List[UUID], user_id: UUID
+    ) -> Set[UUID]:
+        """Implementation of batched membership check."""
+        if not chat_ids:
+            return set()
+
+        rows = session.execute(
+            select(Membership.chat_id).where(
+                Membership.user_id == user_id, Membership.chat_id.in_(chat_ids)
+            )
+        ).scalars()
+        return set(rows)
+
+    def is_member_of(
+        self, chat_ids: List[UUID], user_id: UUID, session: Optional[Session] = None
+    ) -> Set[UUID]:
+        """Get the subset of chat_ids the user is a member of, in one query."""
+        return cast(
+            Set[UUID],
+            self._execute_with_session(
+                lambda s: self._is_member_of_implementation(s, chat_ids, user_id),
+                session=session,
+                operation_name="is_member_of",
+            ),
+        )
+
     def _get_chat_by_id_implementation(
         self, session: Session, chat_id: UUID
     ) -> Optional[Chat]:
         """Implementation of chat retrieval by ID."""
-        return cast(
-            Optional[Chat], session.query(Chat).filter(Chat.id == chat_id).one_or_none()
-        )
+        # Identity-map hit when the chat was already loaded in this session
+        return cast(Optional[Chat], session.get(Chat, chat_id))
 
     def get_chat_by_id(
         self, chat_id: UUID, session: Optional[Session] = None
@@ -254,6 +339,45 @@ class ChatRepo(BaseRepo):
             ),
         )
 
+    def _is_group_chat_implementation(self, session: Session, chat_id: UUID) -> bool:
+        """Implementation of group chat check."""
+        # Chat type never changes, so the identity-mapped row answers repeat checks
+        return isinstance(
+            self._get_chat_by_id_implementation(session, chat_id), GroupChat
+        )
+
+    def is_group_chat(self, chat_id: UUID, session: Optional[Session] = None) -> bool:
+        """Check if a chat is a group chat."""
+        return cast(
+            bool,
+            self._execute_with_session(
+                lambda s: self._is_group_chat_implementation(s, chat_id),
+                session=session,
+                operation_name="is_group_chat",
+            ),
+        )
+
+    def _is_direct_message_implementation(
+        self, session: Session, chat_id: UUID
+    ) -> bool:
+        """Implementation of direct message check."""
+        return isinstance(
+            self._get_chat_by_id_implementation(session, chat_id), DirectMessage
+        )
+
+    def is_direct_message(
+        self, chat_id: UUID, session: Optional[Session] = None
+    ) -> bool:
+        """Check if a chat is a direct message."""
+        return cast(
+            bool,
+            self._execute_with_session(
+                lambda s: self._is_direct_message_implementation(s, chat_id),
+                session=session,
+                operation_name="is_direct_message",
+            ),
+        )
+
     def _get_chat_members_implementation(
         self, session: Session, chat_id: UUID
     ) -> List[Membership]:
@@ -280,3 +404,139 @@ class ChatRepo(BaseRepo):
                 operation_name="get_chat_members",
             ),
         )
+
+    def _get_member_roles_implementation(
+        self, session: Session, chat_id: UUID
+    ) -> Dict[UUID, MemberRole]:
+        """Implementation of member role map retrieval."""
+        rows = session.execute(
+            select(Membership.user_id, Membership.role).where(
+                Membership.chat_id == chat_id
+            )
+        )
+        return dict(rows)
+
+    def get_member_roles(
+        self, chat_id: UUID, session: Optional[Session] = None
+    ) -> Dict[UUID, MemberRole]:
+        """Get a user_id -> role map for a chat in one query.
+
+        Lets callers answer several membership/role questions about the same chat
+        without a round-trip per check.
+        """
+        return cast(
+            Dict[UUID, MemberRole],
+            self._execute_with_session(
+                lambda s: self._get_member_roles_implementation(s, chat_id),
+                session=session,
+                operation_name="get_member_roles",
+            ),
+        )
+
+    def _get_roles_for_users_implementation(
+        self, session: Session, chat_id: UUID, user_ids: List[UUID]
+    ) -> Dict[UUID, MemberRole]:
+        """Implementation of role lookup for specific users."""
+        if not user_ids:
+            return {}
+
+        rows = session.execute(
+            select(Membership.user_id, Membership.role).where(
+                Membership.chat_id == chat_id, Membership.user_id.in_(user_ids)
+            )
+        )
+        return dict(rows)
+
+    def get_roles_for_users(
+        self, chat_id: UUID, user_ids: List[UUID], session: Optional[Session] = None
+    ) -> Dict[UUID, MemberRole]:
+        """Get roles of the given users in a chat; non-members are omitted."""
+        return cast(
+            Dict[UUID, MemberRole],
+            self._execute_with_session(
+                lambda s: self._get_roles_for_users_implementation(
+                    s, chat_id, user_ids
+                ),
+                session=session,
+                operation_name="get_roles_for_users",
+            ),
+        )
+
+    def _count_admins_implementation(self, session: Session, chat_id: UUID) -> int:
+        """Implementation of admin count."""
+        return cast(
+            int,
+            session.execute(
+                select(func.count())
+                .select_from(Membership)
+                .where(
+                    Membership.chat_id == chat_id, Membership.role == MemberRole.ADMIN
+                )
+            ).scalar_one(),
+        )
+
+    def count_admins(self, chat_id: UUID, session: Optional[Session] = None) -> int:
+        """Count the admins of a chat without loading membership rows."""
+        return cast(
+            int,
+            self._execute_with_session(
+                lambda s: self._count_admins_implementation(s, chat_id),
+                session=session,
+                operation_name="count_admins",
+            ),
+        )
+
+    def _get_first_admin_user_id_implementation(
+        self, session: Session, chat_id: UUID
+    ) -> Optional[UUID]:
+        """Implementation of earliest-joined admin lookup."""
+        # Served by ix_membership_chat_role_joined
+        return cast(
+            Optional[UUID],
+            session.execute(
+                select(Membership.user_id)
+                .where(
+                    Membership.chat_id == chat_id, Membership.role == MemberRole.ADMIN
+                )
+                .order_by(Membership.joined_at.asc())
+                .limit(1)
+            ).scalar_one_or_none(),
+        )
+
+    def get_first_admin_user_id(
+        self, chat_id: UUID, session: Optional[Session] = None
+    ) -> Optional[UUID]:
+        """Get the user ID of the longest-standing admin of a chat."""
+        return cast(
+            Optional[UUID],
+            self._execute_with_session(
+                lambda s: self._get_first_admin_user_id_implementation(s, chat_id),
+                session=session,
+                operation_name="get_first_admin_user_id",
+            ),
+        )
+
+    def _list_member_rows_implementation(
+        self, session: Session, chat_id: UUID
+    ) -> List[MemberRow]:
+        """Implementation of member row listing."""
+        # Plain column tuples: no ORM hydration or identity-map bookkeeping
+        rows = session.execute(
+            select(Membership.user_id, Membership.role, Membership.joined_at)
+            .where(Membership.chat_id == chat_id)
+            .order_by(Membership.joined_at.asc())
+        )
+        return [MemberRow(*row) for row in rows]
+
+    def list_member_rows(
+        self, chat_id: UUID, session: Optional[Session] = None
+    ) -> List[MemberRow]:
+        """Get read-only member rows of a chat, oldest member first."""
+        return cast(
+            List[MemberRow],
+            self._execute_with_session(
+                lambda s: self._list_member_rows_implementation(s, chat_id),
+                session=session,
+                operation_name="list_member_rows",
+            ),
+        )
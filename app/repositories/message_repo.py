@@ -1,9 +1,10 @@
 """Message repository."""
 
 from datetime import datetime
-from typing import List, Optional, cast
+from typing import Any, Dict, Iterator, List, Optional, cast
 from uuid import UUID
 
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.core.logging.logging import get_logger
@@ -13,6 +14,18 @@ from app.repositories.base_repo import BaseRepo
 logger = get_logger(__name__)
 
 
+def _find_by_idempotency_key(
+    session: Session, idempotency_key: str
+) -> Optional[Message]:
+    """Look up a message by idempotency key using a cached lambda statement."""
+    # Hot path on every ingest: the lambda is compiled once and the key is
+    # extracted as a bound parameter on each call.
+    stmt = lambda_stmt(
+        lambda: select(Message).where(Message.idempotency_key == idempotency_key)
+    )
+    return cast(Optional[Message], session.execute(stmt).scalars().first())
+
+
 class MessageRepo(BaseRepo):
     """Message repository."""
 
@@ -30,11 +43,7 @@ class MessageRepo(BaseRepo):
         )
 
         # Check idempotency first
-        existing = (
-            session.query(Message)
-            .filter(Message.idempotency_key == idempotency_key)
-            .first()
-        )
+        existing = _find_by_idempotency_key(session, idempotency_key)
         if existing:
             logger.debug(
                 f"Returning existing message for idempotency key {idempotency_key}: {existing.id}"
@@ -76,6 +85,31 @@ class MessageRepo(BaseRepo):
             ),
         )
 
+    def _bulk_create_implementation(
+        self, session: Session, rows: List[Dict[str, Any]]
+    ) -> None:
+        """Implementation of bulk message insertion."""
+        if not rows:
+            return
+
+        # Skips the unit of work and identity map; no Message objects are returned
+        session.bulk_insert_mappings(Message, rows)  # type: ignore[arg-type]
+        logger.info(f"Bulk inserted {len(rows)} messages")
+
+    def bulk_create(
+        self, rows: List[Dict[str, Any]], session: Optional[Session] = None
+    ) -> None:
+        """Insert many messages at once (for imports and seeding).
+
+        Each row is a dict of Message column values. Idempotency keys are not
+        checked for existing messages; duplicates raise IntegrityError.
+        """
+        self._execute_with_session(
+            lambda s: self._bulk_create_implementation(s, rows),
+            session=session,
+            operation_name="bulk_create",
+        )
+
     def _get_chat_history_implementation(
         self,
         session: Session,
@@ -118,6 +152,58 @@ class MessageRepo(BaseRepo):
             ),
         )
 
+    def _stream_chat_history_implementation(
+        self,
+        session: Session,
+        chat_id: UUID,
+        after_timestamp: Optional[datetime],
+        batch_size: int,
+    ) -> Iterator[Message]:
+        """Implementation of streamed chat history retrieval."""
+        query = session.query(Message).filter(Message.chat_id == chat_id)
+
+        if after_timestamp:
+            query = query.filter(Message.created_at > after_timestamp)
+
+        # yield_per uses a server-side cursor and fetches batch_size rows at a time
+        return cast(
+            Iterator[Message],
+            query.order_by(Message.created_at.asc()).yield_per(batch_size),
+        )
+
+    def stream_chat_history(
+        self,
+        chat_id: UUID,
+        after_timestamp: Optional[datetime] = None,
+        batch_size: int = 500,
+        session: Optional[Session] = None,
+    ) -> Iterator[Message]:
+        """Stream chat message history in batches without buffering all rows."""
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+
+        if session is not None:
+            # Coordinated mode - caller owns the session
+            return self._stream_chat_history_implementation(
+                session, chat_id, after_timestamp, batch_size
+            )
+        return self._stream_with_own_session(chat_id, after_timestamp, batch_size)
+
+    def _stream_with_own_session(
+        self, chat_id: UUID, after_timestamp: Optional[datetime], batch_size: int
+    ) -> Iterator[Message]:
+        """Keep a dedicated session open for as long as the stream is consumed."""
+        session = self.session_factory()
+        try:
+            yield from self._stream_chat_history_implementation(
+                session, chat_id, after_timestamp, batch_size
+            )
+        except Exception as e:
+            self._log_error("stream_chat_history", e)
+            raise
+        finally:
+            session.close()
+
     def _get_chat_history_before_implementation(
         self, session: Session, chat_id: UUID, before_timestamp: datetime, limit: int
     ) -> List[Message]:
@@ -163,14 +249,7 @@ class MessageRepo(BaseRepo):
         self, session: Session, idempotency_key: str
     ) -> Optional[Message]:
         """Implementation of message retrieval by idempotency key."""
-        return cast(
-            Optional[Message],
-            (
-                session.query(Message)
-                .filter(Message.idempotency_key == idempotency_key)
-                .first()
-            ),
-        )
+        return _find_by_idempotency_key(session, idempotency_key)
 
     def get_by_idempotency_key(
         self, idempotency_key: str, session: Optional[Session] = None
@@ -1,4 +1,4 @@
-"""Transaction context manager for coordinated multi-repository operations."""
+"""Transaction context managers for coordinated multi-repository operations."""
 
 from contextlib import contextmanager
 from typing import Generator
@@ -42,3 +42,35 @@ def transaction_scope(session_factory) -> Generator[Session, None, None]:
         except Exception:
             # Ignore close errors - session cleanup is best effort
             pass
+
+
+@contextmanager
+def savepoint_scope(session: Session) -> Generator[Session, None, None]:
+    """
+    Context manager for a SAVEPOINT inside an open transaction.
+
+    Lets a single step of a larger ``transaction_scope`` block fail and roll
+    back on its own while earlier work stays pending, so the whole batch still
+    goes out with one COMMIT.
+
+    Usage:
+        with transaction_scope(SessionLocal) as session:
+            user = user_repo.create_user(..., session=session)
+            try:
+                with savepoint_scope(session):
+                    chat_repo.add_member(..., session=session)
+            except IntegrityError:
+                pass  # Only the add_member step is rolled back
+
+    Args:
+        session: Session with an open transaction (e.g. from transaction_scope)
+
+    Yields:
+        Session: The same session, now inside the savepoint
+
+    Raises:
+        Exception: Any exception from the wrapped step (after rolling back
+            to the savepoint)
+    """
+    with session.begin_nested():
+        yield session
@@ -22,8 +22,9 @@ class UserRepo(BaseRepo):
         """Implementation of user creation."""
         logger.debug(f"Creating user with username: {username}")
 
-        # Input validation
-        if not username or not username.strip():
+        # Input validation; strip once and reuse for the insert
+        stripped_username = username.strip() if username else ""
+        if not stripped_username:
             logger.warning("Attempted to create user with empty username")
             raise ValueError("Username cannot be empty or whitespace-only")
         if len(username) > 255:
@@ -37,7 +38,7 @@ class UserRepo(BaseRepo):
             )
             raise ValueError("Password hash cannot be empty")
 
-        user = User(username=username.strip(), password_hash=password_hash)
+        user = User(username=stripped_username, password_hash=password_hash)
         session.add(user)
         session.flush()  # Generate ID without committing
 
@@ -74,9 +75,9 @@ class UserRepo(BaseRepo):
         elif user_id is None:
             raise ValueError("User ID cannot be None")
 
-        return cast(
-            Optional[User], session.query(User).filter(User.id == user_id).one_or_none()
-        )
+        # session.get checks the identity map first, so repeated lookups within
+        # one request-scoped session don't hit the database again
+        return cast(Optional[User], session.get(User, user_id))
 
     def get_user_by_id(
         self, user_id: UUID, session: Optional[Session] = None
@@ -1,16 +1,69 @@
 """Authentication schemas for API validation."""
 
+import string
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional, Tuple
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+
+# Compiled once by pydantic-core when the models are built; shared by every
+# schema that accepts a new username so the rule lives in one place
+USERNAME_PATTERN = r"^[a-zA-Z0-9_]+$"
+
+Username = Annotated[
+    str, StringConstraints(min_length=3, max_length=50, pattern=USERNAME_PATTERN)
+]
+
+
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_DIGITS = frozenset(string.digits)
+
+
+def _password_char_classes(password: str) -> Tuple[bool, bool, bool]:
+    """Return whether the password has an uppercase, lowercase and digit char."""
+    if password.isascii():
+        # For ASCII, str.isupper/islower/isdigit match these sets exactly;
+        # isdisjoint scans the string in C and stops at the first hit
+        return (
+            not _ASCII_UPPER.isdisjoint(password),
+            not _ASCII_LOWER.isdisjoint(password),
+            not _ASCII_DIGITS.isdisjoint(password),
+        )
+
+    has_upper = has_lower = has_digit = False
+    for c in password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit:
+            break
+    return has_upper, has_lower, has_digit
+
+
+def _validate_password_strength(password: str) -> str:
+    """Check for an uppercase letter, a lowercase letter and a digit."""
+    has_upper, has_lower, has_digit = _password_char_classes(password)
+
+    if not has_upper:
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not has_lower:
+        raise ValueError("Password must contain at least one lowercase letter")
+    if not has_digit:
+        raise ValueError("Password must contain at least one digit")
+    return password
 
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
 
-    username: str = Field(..., min_length=3, max_length=50, pattern="^[a-zA-Z0-9_]+$")
+    username: Username
 
 
 class UserCreate(UserBase):
@@ -22,21 +75,13 @@ class UserCreate(UserBase):
     @classmethod
     def validate_password(cls, v):
         """Validate password strength."""
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _validate_password_strength(v)
 
 
 class UserUpdate(BaseModel):
     """Schema for user profile updates."""
 
-    username: Optional[str] = Field(
-        None, min_length=3, max_length=50, pattern="^[a-zA-Z0-9_]+$"
-    )
+    username: Optional[Username] = None
     password: Optional[str] = Field(None, min_length=8, max_length=100)
 
     @field_validator("password")
@@ -44,12 +89,7 @@ class UserUpdate(BaseModel):
     def validate_password(cls, v):
         """Validate password strength."""
         if v is not None:
-            if not any(c.isupper() for c in v):
-                raise ValueError("Password must contain at least one uppercase letter")
-            if not any(c.islower() for c in v):
-                raise ValueError("Password must contain at least one lowercase letter")
-            if not any(c.isdigit() for c in v):
-                raise ValueError("Password must contain at least one digit")
+            return _validate_password_strength(v)
         return v
 
 
@@ -61,8 +101,7 @@ class UserResponse(UserBase):
     last_login_at: Optional[datetime]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
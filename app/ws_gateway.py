@@ -6,10 +6,11 @@ Real implementation will be added incrementally.
 """
 
 import asyncio
-import json
 import logging
-from typing import Dict, Set
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Set
 
+import orjson
 import websockets
 from websockets.server import WebSocketServerProtocol
 
@@ -20,6 +21,30 @@ logger = logging.getLogger(__name__)
 # Store active connections
 active_connections: Set[WebSocketServerProtocol] = set()
 
+# chat_id -> subscribed sockets, plus the reverse map for cleanup on disconnect
+subscriptions: Dict[str, Set[WebSocketServerProtocol]] = defaultdict(set)
+_socket_chats: Dict[WebSocketServerProtocol, Set[str]] = {}
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    """Serialize a payload for a text frame."""
+    return orjson.dumps(payload).decode()
+
+
+# Constant frames, serialized once at import
+_WELCOME = _dumps(
+    {
+        "type": "connection.established",
+        "message": "Connected to OpChat WebSocket Gateway",
+    }
+)
+_PONG = _dumps({"type": "pong"})
+_ERR_INVALID_JSON = _dumps({"type": "error", "message": "Invalid JSON format"})
+_ERR_INTERNAL = _dumps({"type": "error", "message": "Internal server error"})
+_ERR_NO_CHAT_ID = _dumps(
+    {"type": "error", "message": "Missing chat_id for subscription"}
+)
+
 
 async def handle_connection(websocket: WebSocketServerProtocol, path: str):
     """Handle a new WebSocket connection."""
@@ -29,68 +54,101 @@ async def handle_connection(websocket: WebSocketServerProtocol, path: str):
 
     try:
         # Send welcome message
-        await websocket.send(
-            json.dumps(
-                {
-                    "type": "connection.established",
-                    "message": "Connected to OpChat WebSocket Gateway",
-                }
-            )
-        )
+        await websocket.send(_WELCOME)
 
         # Keep connection alive and handle messages
         async for message in websocket:
             try:
-                data = json.loads(message)
+                data = orjson.loads(message)
                 await handle_message(websocket, data)
-            except json.JSONDecodeError:
-                await websocket.send(
-                    json.dumps({"type": "error", "message": "Invalid JSON format"})
-                )
+            except orjson.JSONDecodeError:
+                await websocket.send(_ERR_INVALID_JSON)
             except Exception as e:
                 logger.error(f"Error handling message: {e}")
-                await websocket.send(
-                    json.dumps({"type": "error", "message": "Internal server error"})
-                )
+                await websocket.send(_ERR_INTERNAL)
 
     except websockets.exceptions.ConnectionClosed:
         logger.info(f"WebSocket connection closed: {client_address}")
     finally:
         active_connections.discard(websocket)
+        _unsubscribe_all(websocket)
 
 
-async def handle_message(websocket: WebSocketServerProtocol, data: Dict):
-    """Handle incoming WebSocket messages."""
-    message_type = data.get("type")
+def _unsubscribe_all(websocket: WebSocketServerProtocol):
+    """Drop a socket from every chat it subscribed to."""
+    for chat_id in _socket_chats.pop(websocket, ()):
+        subscribers = subscriptions.get(chat_id)
+        if subscribers is not None:
+            subscribers.discard(websocket)
+            if not subscribers:
+                del subscriptions[chat_id]
 
-    if message_type == "ping":
-        await websocket.send(json.dumps({"type": "pong"}))
-    elif message_type == "subscribe":
-        chat_id = data.get("chat_id")
-        if chat_id:
-            await websocket.send(
-                json.dumps({"type": "subscription.confirmed", "chat_id": chat_id})
-            )
-        else:
-            await websocket.send(
-                json.dumps(
-                    {"type": "error", "message": "Missing chat_id for subscription"}
-                )
-            )
-    else:
+
+def broadcast(chat_id: str, payload: str):
+    """Send a pre-serialized frame to every socket subscribed to a chat."""
+    subscribers = subscriptions.get(chat_id)
+    if subscribers:
+        # Non-blocking fan-out; slow or closing sockets are skipped, not awaited
+        websockets.broadcast(subscribers, payload)
+
+
+async def _handle_ping(websocket: WebSocketServerProtocol, data: Dict):
+    """Reply to a keepalive ping."""
+    await websocket.send(_PONG)
+
+
+async def _handle_subscribe(websocket: WebSocketServerProtocol, data: Dict):
+    """Confirm a chat subscription."""
+    chat_id = data.get("chat_id")
+    if chat_id:
+        chat_key = str(chat_id)
+        subscriptions[chat_key].add(websocket)
+        _socket_chats.setdefault(websocket, set()).add(chat_key)
         await websocket.send(
-            json.dumps(
-                {"type": "error", "message": f"Unknown message type: {message_type}"}
-            )
+            _dumps({"type": "subscription.confirmed", "chat_id": chat_id})
         )
+    else:
+        await websocket.send(_ERR_NO_CHAT_ID)
+
+
+async def _handle_unknown(websocket: WebSocketServerProtocol, data: Dict):
+    """Reject a message with an unsupported type."""
+    message_type = data.get("type")
+    await websocket.send(
+        _dumps({"type": "error", "message": f"Unknown message type: {message_type}"})
+    )
+
+
+# Message type -> handler
+_HANDLERS: Dict[str, Callable[[WebSocketServerProtocol, Dict], Awaitable[None]]] = {
+    "ping": _handle_ping,
+    "subscribe": _handle_subscribe,
+}
+
+
+async def handle_message(websocket: WebSocketServerProtocol, data: Dict):
+    """Handle incoming WebSocket messages."""
+    message_type = data.get("type")
+    handler = (
+        _HANDLERS.get(message_type, _handle_unknown)
+        if isinstance(message_type, str)
+        else _handle_unknown
+    )
+    await handler(websocket, data)
 
 
 async def main():
     """Start the WebSocket server."""
     logger.info("Starting OpChat WebSocket Gateway on port 8001")
 
+    # Frames are small JSON payloads; permessage-deflate costs more CPU than it saves
     server = await websockets.serve(
-        handle_connection, "0.0.0.0", 8001, ping_interval=20, ping_timeout=10
+        handle_connection,
+        "0.0.0.0",
+        8001,
+        ping_interval=20,
+        ping_timeout=10,
+        compression=None,
     )
 
     logger.info("WebSocket Gateway is running on ws://0.0.0.0:8001")
@@ -100,4 +158,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Prefer the libuv-based loop when available (installed with uvicorn[standard])
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
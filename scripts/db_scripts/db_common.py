@@ -0,0 +1,100 @@
+"""
+Shared helpers for the OpChat database scripts.
+
+Imported by the scripts in this directory, which run with it on sys.path:
+    from db_common import get_estimated_row_counts
+"""
+
+import hashlib
+import os
+import uuid
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import ProgrammingError
+
+# PostgreSQL SQLSTATE raised when the role lacks TRUNCATE on a table
+INSUFFICIENT_PRIVILEGE = "42501"
+# Seed hashes protect nothing, so use passlib's minimum bcrypt cost by default
+DEFAULT_SEED_BCRYPT_ROUNDS = 4
+
+
+def create_database_engine(database_url):
+    """Create an engine that checks pooled connections before reusing them."""
+    # pre_ping survives server restarts; LIFO keeps reusing the warmest connection
+    return create_engine(database_url, pool_pre_ping=True, pool_use_lifo=True)
+
+
+def create_seed_password_context():
+    """Create the bcrypt context used to hash seed user passwords."""
+    # Imported here so scripts that never hash do not need passlib installed
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=int(os.getenv("SEED_BCRYPT_ROUNDS", DEFAULT_SEED_BCRYPT_ROUNDS)),
+    )
+
+
+def create_deterministic_uuid(seed_string: str) -> uuid.UUID:
+    """Create a deterministic UUID from a seed string."""
+    # BLAKE2b emits exactly the 16 bytes a UUID needs, no truncation required
+    hash_bytes = hashlib.blake2b(seed_string.encode(), digest_size=16).digest()
+    return uuid.UUID(bytes=hash_bytes)
+
+
+def create_deterministic_uuids(seed_strings):
+    """Create deterministic UUIDs for many seeds; see create_deterministic_uuid."""
+    # Bind the hash and UUID constructors once instead of per seed
+    blake2b = hashlib.blake2b
+    make_uuid = uuid.UUID
+    return [
+        make_uuid(bytes=blake2b(seed.encode(), digest_size=16).digest())
+        for seed in seed_strings
+    ]
+
+
+def get_estimated_row_counts(conn, table_names):
+    """Get planner row estimates for tables from pg_class.
+
+    reltuples is -1 (or 0 before PostgreSQL 14) until a table is analyzed.
+    """
+    rows = conn.execute(
+        text(
+            """
+        SELECT relname, reltuples::bigint FROM pg_class
+        WHERE relname = ANY(:table_names)
+          AND relkind = 'r'
+          AND pg_table_is_visible(oid)
+    """
+        ),
+        {"table_names": list(table_names)},
+    ).fetchall()
+    return dict(rows)
+
+
+def truncate_models(session, models):
+    """Truncate the tables of several models in one statement (PostgreSQL only)."""
+    table_names = ", ".join(f'"{model.__tablename__}"' for model in models)
+    session.execute(text(f"TRUNCATE TABLE {table_names} RESTART IDENTITY CASCADE"))
+
+
+def is_insufficient_privilege(error):
+    """Check whether a database error means the role lacks a privilege."""
+    return getattr(error.orig, "pgcode", None) == INSUFFICIENT_PRIVILEGE
+
+
+def try_truncate_models(session, models):
+    """Truncate models inside a savepoint; return False without the privilege.
+
+    Roles that are only granted DML (like the app role) cannot TRUNCATE, so
+    callers fall back to deleting rows when this returns False.
+    """
+    try:
+        with session.begin_nested():
+            truncate_models(session, models)
+    except ProgrammingError as e:
+        if not is_insufficient_privilege(e):
+            raise
+        return False
+    return True
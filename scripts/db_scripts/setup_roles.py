@@ -13,9 +13,11 @@ Usage:
 
 import os
 import sys
+from functools import lru_cache
 
 try:
-    from sqlalchemy import create_engine, text
+    from db_common import create_database_engine
+    from sqlalchemy import text
 except ImportError:
     print("Error: SQLAlchemy not installed. Please install it first:")
     print("pip install sqlalchemy psycopg2-binary")
@@ -33,16 +35,19 @@ EXPECTED_ROLE_COUNT = 2
 TEST_TABLE_NAME = "test_migration_table"
 
 
+@lru_cache(maxsize=1)
 def get_migration_password():
     """Get migration role password from environment."""
     return os.getenv("MIGRATION_DB_PASSWORD", DEFAULT_MIGRATION_PASSWORD)
 
 
+@lru_cache(maxsize=1)
 def get_app_password():
     """Get app role password from environment."""
     return os.getenv("APP_DB_PASSWORD", DEFAULT_APP_PASSWORD)
 
 
+@lru_cache(maxsize=1)
 def get_admin_database_url():
     """Get admin database URL from environment."""
     return os.getenv("ADMIN_DATABASE_URL", DEFAULT_ADMIN_URL)
@@ -78,6 +83,14 @@ def parse_database_url(database_url):
     }
 
 
+def get_role_database_url(config, role, password):
+    """Build the connection URL for a role on the configured database."""
+    return (
+        f"postgresql://{role}:{password}@{config['host']}:{config['port']}"
+        f"/{config['database']}"
+    )
+
+
 def get_database_config():
     """Get database configuration from environment variables."""
     database_url = get_admin_database_url()
@@ -125,69 +138,54 @@ def create_roles(engine, config):
             raise
 
 
-def grant_connection_permissions(conn, database):
-    """Grant database connection permissions to roles."""
-    conn.execute(text(f"GRANT CONNECT ON DATABASE {database} TO {MIGRATION_ROLE}"))
-    conn.execute(text(f"GRANT CONNECT ON DATABASE {database} TO {APP_ROLE}"))
+def grant_connection_permissions(database):
+    """Build statements granting database connection permissions to roles."""
+    return [
+        f"GRANT CONNECT ON DATABASE {database} TO {MIGRATION_ROLE}",
+        f"GRANT CONNECT ON DATABASE {database} TO {APP_ROLE}",
+    ]
 
 
-def grant_schema_permissions(conn):
-    """Grant schema usage permissions to roles."""
-    conn.execute(text(f"GRANT USAGE ON SCHEMA public TO {MIGRATION_ROLE}"))
-    conn.execute(text(f"GRANT USAGE ON SCHEMA public TO {APP_ROLE}"))
+def grant_schema_permissions():
+    """Build statements granting schema usage permissions to roles."""
+    return [
+        f"GRANT USAGE ON SCHEMA public TO {MIGRATION_ROLE}",
+        f"GRANT USAGE ON SCHEMA public TO {APP_ROLE}",
+    ]
 
 
-def grant_migration_permissions(conn):
-    """Grant DDL permissions to migration role."""
-    conn.execute(text(f"GRANT CREATE ON SCHEMA public TO {MIGRATION_ROLE}"))
-    conn.execute(
-        text(f"GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO {MIGRATION_ROLE}")
-    )
-    conn.execute(
-        text(
-            f"GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO {MIGRATION_ROLE}"
-        )
-    )
+def grant_migration_permissions():
+    """Build statements granting DDL permissions to migration role."""
+    return [
+        f"GRANT CREATE ON SCHEMA public TO {MIGRATION_ROLE}",
+        f"GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO {MIGRATION_ROLE}",
+        f"GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO {MIGRATION_ROLE}",
+    ]
 
 
-def grant_default_privileges(conn):
-    """Set up default privileges for future objects."""
-    # Tables
-    conn.execute(
-        text(
-            f"""
-        ALTER DEFAULT PRIVILEGES FOR ROLE {MIGRATION_ROLE} IN SCHEMA public
-        GRANT SELECT, INSERT, UPDATE, DELETE ON TABLES TO {APP_ROLE}
-    """
-        )
-    )
-
-    # Sequences
-    conn.execute(
-        text(
-            f"""
-        ALTER DEFAULT PRIVILEGES FOR ROLE {MIGRATION_ROLE} IN SCHEMA public
-        GRANT USAGE, SELECT ON SEQUENCES TO {APP_ROLE}
-    """
-        )
-    )
+def grant_default_privileges():
+    """Build statements setting up default privileges for future objects."""
+    return [
+        # Tables
+        f"ALTER DEFAULT PRIVILEGES FOR ROLE {MIGRATION_ROLE} IN SCHEMA public "
+        f"GRANT SELECT, INSERT, UPDATE, DELETE ON TABLES TO {APP_ROLE}",
+        # Sequences
+        f"ALTER DEFAULT PRIVILEGES FOR ROLE {MIGRATION_ROLE} IN SCHEMA public "
+        f"GRANT USAGE, SELECT ON SEQUENCES TO {APP_ROLE}",
+    ]
 
 
-def grant_app_permissions(conn):
-    """Grant data-only permissions to app role."""
-    conn.execute(
-        text(
-            f"GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA public TO {APP_ROLE}"
-        )
-    )
-    conn.execute(
-        text(f"GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA public TO {APP_ROLE}")
-    )
+def grant_app_permissions():
+    """Build statements granting data-only permissions to app role."""
+    return [
+        f"GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA public TO {APP_ROLE}",
+        f"GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA public TO {APP_ROLE}",
+    ]
 
 
-def grant_role_membership(conn):
-    """Grant app role membership to migration role."""
-    conn.execute(text(f"GRANT {APP_ROLE} TO {MIGRATION_ROLE}"))
+def grant_role_membership():
+    """Build the statement granting app role membership to migration role."""
+    return [f"GRANT {APP_ROLE} TO {MIGRATION_ROLE}"]
 
 
 def setup_permissions(engine, config):
@@ -200,12 +198,17 @@ def setup_permissions(engine, config):
         try:
             database = config["database"]
 
-            grant_connection_permissions(conn, database)
-            grant_schema_permissions(conn)
-            grant_migration_permissions(conn)
-            grant_default_privileges(conn)
-            grant_app_permissions(conn)
-            grant_role_membership(conn)
+            statements = [
+                *grant_connection_permissions(database),
+                *grant_schema_permissions(),
+                *grant_migration_permissions(),
+                *grant_default_privileges(),
+                *grant_app_permissions(),
+                *grant_role_membership(),
+            ]
+            # Role and database names are trusted constants, so the GRANTs can be
+            # sent as one unparameterized multi-statement batch in one round trip
+            conn.exec_driver_sql(";\n".join(statements))
 
             trans.commit()
             print("  Permissions set up successfully!")
@@ -248,33 +251,24 @@ def verify_roles_exist(engine):
         print("  Basic role properties: OK")
 
 
-def test_migration_role_connection(config):
+def test_migration_role_connection(migration_engine):
     """Test connection as migration role."""
-    migration_url = f"postgresql://{MIGRATION_ROLE}:{get_migration_password()}@{config['host']}:{config['port']}/{config['database']}"
-    migration_engine = create_engine(migration_url)
-
     with migration_engine.connect() as conn:
         conn.execute(text("SELECT 1"))
 
     print("  Migration role connection: OK")
 
 
-def test_app_role_connection(config):
+def test_app_role_connection(app_engine):
     """Test connection as app role."""
-    app_url = f"postgresql://{APP_ROLE}:{get_app_password()}@{config['host']}:{config['port']}/{config['database']}"
-    app_engine = create_engine(app_url)
-
     with app_engine.connect() as conn:
         conn.execute(text("SELECT 1"))
 
     print("  App role connection: OK")
 
 
-def test_migration_role_ddl(config):
+def test_migration_role_ddl(migration_engine):
     """Test DDL operations for migration role."""
-    migration_url = f"postgresql://{MIGRATION_ROLE}:{get_migration_password()}@{config['host']}:{config['port']}/{config['database']}"
-    migration_engine = create_engine(migration_url)
-
     with migration_engine.connect() as conn:
         trans = conn.begin()
         try:
@@ -303,11 +297,8 @@ def test_migration_role_ddl(config):
     print("  Migration role DDL operations: OK")
 
 
-def test_app_role_dml(config):
+def test_app_role_dml(app_engine):
     """Test DML operations for app role."""
-    app_url = f"postgresql://{APP_ROLE}:{get_app_password()}@{config['host']}:{config['port']}/{config['database']}"
-    app_engine = create_engine(app_url)
-
     with app_engine.connect() as conn:
         trans = conn.begin()
         try:
@@ -338,11 +329,8 @@ def test_app_role_dml(config):
     print("  App role DML operations: OK")
 
 
-def test_app_role_ddl_restriction(config):
+def test_app_role_ddl_restriction(app_engine):
     """Test that app role cannot perform DDL operations."""
-    app_url = f"postgresql://{APP_ROLE}:{get_app_password()}@{config['host']}:{config['port']}/{config['database']}"
-    app_engine = create_engine(app_url)
-
     with app_engine.connect() as conn:
         try:
             conn.execute(text("CREATE TABLE should_fail (id INTEGER)"))
@@ -354,11 +342,8 @@ def test_app_role_ddl_restriction(config):
     print("  App role DDL restrictions: OK")
 
 
-def test_default_privileges(config):
+def test_default_privileges(migration_engine, app_engine):
     """Test default privileges on new objects."""
-    migration_url = f"postgresql://{MIGRATION_ROLE}:{get_migration_password()}@{config['host']}:{config['port']}/{config['database']}"
-    migration_engine = create_engine(migration_url)
-
     # Create new table as migration role
     with migration_engine.connect() as conn:
         trans = conn.begin()
@@ -375,9 +360,6 @@ def test_default_privileges(config):
             raise Exception(f"Failed to create test table: {e}") from e
 
     # Test app role can access the new table
-    app_url = f"postgresql://{APP_ROLE}:{get_app_password()}@{config['host']}:{config['port']}/{config['database']}"
-    app_engine = create_engine(app_url)
-
     with app_engine.connect() as conn:
         trans = conn.begin()
         try:
@@ -408,11 +390,8 @@ def test_default_privileges(config):
     print("  Default privileges: OK")
 
 
-def cleanup_test_table(config):
+def cleanup_test_table(migration_engine):
     """Clean up test table created during verification."""
-    migration_url = f"postgresql://{MIGRATION_ROLE}:{get_migration_password()}@{config['host']}:{config['port']}/{config['database']}"
-    migration_engine = create_engine(migration_url)
-
     with migration_engine.connect() as conn:
         trans = conn.begin()
         try:
@@ -427,26 +406,38 @@ def verify_roles(engine, config):
     """Verify that roles were created with correct permissions."""
     print("Verifying roles...")
 
+    # One engine per role, shared by every check instead of rebuilt per test
+    migration_engine = create_database_engine(
+        get_role_database_url(config, MIGRATION_ROLE, get_migration_password())
+    )
+    app_engine = create_database_engine(
+        get_role_database_url(config, APP_ROLE, get_app_password())
+    )
+
     try:
         verify_roles_exist(engine)
-        test_migration_role_connection(config)
-        test_app_role_connection(config)
-        test_migration_role_ddl(config)
-        test_app_role_dml(config)
-        test_app_role_ddl_restriction(config)
-        test_default_privileges(config)
-        cleanup_test_table(config)
+        test_migration_role_connection(migration_engine)
+        test_app_role_connection(app_engine)
+        test_migration_role_ddl(migration_engine)
+        test_app_role_dml(app_engine)
+        test_app_role_ddl_restriction(app_engine)
+        test_default_privileges(migration_engine, app_engine)
+        cleanup_test_table(migration_engine)
 
         print("  Role verification completed successfully!")
 
     except Exception:
         # Attempt cleanup on failure
         try:
-            cleanup_test_table(config)
+            cleanup_test_table(migration_engine)
         except Exception:
             pass  # Cleanup failure is not critical
         raise
 
+    finally:
+        migration_engine.dispose()
+        app_engine.dispose()
+
 
 def print_connection_strings(config):
     """Print database connection strings for the new roles."""
@@ -497,7 +488,7 @@ def main():
 
         # Create engine with admin privileges
         admin_url = f"postgresql://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
-        engine = create_engine(admin_url)
+        engine = create_database_engine(admin_url)
 
         # Test connection and get version
         version_info = test_database_connection(engine)
@@ -9,7 +9,8 @@ import sys
 from pathlib import Path
 
 try:
-    from sqlalchemy import create_engine, text
+    from db_common import create_database_engine
+    from sqlalchemy import text
 except ImportError:
     print("Error: SQLAlchemy not installed. Please install it first:")
     print("pip install sqlalchemy psycopg2-binary")
@@ -25,6 +26,7 @@ SEPARATOR_LINE = "=" * 50
 MAX_SAMPLE_USERS = 5
 MAX_SAMPLE_MESSAGES = 10
 MAX_SAMPLE_CHATS = 4
+MAX_INHERITANCE_ISSUES = 10
 
 # Table definitions for row counting
 TABLES_TO_COUNT = [
@@ -55,9 +57,16 @@ def print_row_counts(conn):
     print("\nRow Counts:")
     total_records = 0
 
-    for table, display_name in TABLES_TO_COUNT:
-        result = conn.execute(text(f"SELECT COUNT(*) FROM {table}"))
-        count = result.scalar()
+    # One UNION ALL round trip instead of a COUNT query per table. Table names
+    # are quoted: a bare FROM user would count the current_user function row.
+    count_query = " UNION ALL ".join(
+        f'SELECT {position}, COUNT(*) FROM "{table}"'
+        for position, (table, _) in enumerate(TABLES_TO_COUNT)
+    )
+    counts = dict(conn.execute(text(count_query)).all())
+
+    for position, (_, display_name) in enumerate(TABLES_TO_COUNT):
+        count = counts[position]
         print(f"  {display_name:15}: {count:,}")
         total_records += count
 
@@ -180,30 +189,28 @@ def verify_membership_uniqueness(conn):
 
 def verify_chat_inheritance(conn):
     """Verify chat inheritance integrity."""
+    # Filter in SQL so only broken chats come back; the window count reports
+    # how many there are in total while the rows are capped to a sample
     result = conn.execute(
         text(
-            """
-        SELECT c.id, c.type,
-               CASE WHEN dm.id IS NOT NULL THEN 1 ELSE 0 END as has_dm,
-               CASE WHEN gc.id IS NOT NULL THEN 1 ELSE 0 END as has_group
+            f"""
+        SELECT c.id, c.type, COUNT(*) OVER () as issue_count
         FROM chat c
         LEFT JOIN direct_message dm ON c.id = dm.id
         LEFT JOIN group_chat gc ON c.id = gc.id
+        WHERE (c.type = 'dm' AND (dm.id IS NULL OR gc.id IS NOT NULL))
+           OR (c.type = 'group' AND (gc.id IS NULL OR dm.id IS NOT NULL))
+        LIMIT {MAX_INHERITANCE_ISSUES}
     """
         )
     )
-
-    inheritance_issues = []
-    for chat_id, chat_type, has_dm, has_group in result:
-        if chat_type == "dm" and (has_dm != 1 or has_group != 0):
-            inheritance_issues.append(f"DM chat {chat_id} has incorrect inheritance")
-        elif chat_type == "group" and (has_dm != 0 or has_group != 1):
-            inheritance_issues.append(f"Group chat {chat_id} has incorrect inheritance")
+    inheritance_issues = result.fetchall()
 
     if inheritance_issues:
-        print("  FAIL: Chat inheritance issues:")
-        for issue in inheritance_issues:
-            print(f"     - {issue}")
+        print(f"  FAIL: {inheritance_issues[0][2]} chat inheritance issues:")
+        for chat_id, chat_type, _ in inheritance_issues:
+            label = "DM" if chat_type == "dm" else "Group"
+            print(f"     - {label} chat {chat_id} has incorrect inheritance")
     else:
         print("  PASS: Chat inheritance integrity: OK")
 
@@ -243,36 +250,31 @@ def verify_data_quality(conn):
     """Verify basic data quality."""
     print("\nData Quality:")
 
-    # Check for empty usernames
+    # Usernames, message content and DM key format checked in one round trip
     result = conn.execute(
-        text("SELECT COUNT(*) FROM \"user\" WHERE username IS NULL OR username = ''")
+        text(
+            """
+        SELECT
+            (SELECT COUNT(*) FROM "user" WHERE username IS NULL OR username = '') as empty_usernames,
+            (SELECT COUNT(*) FROM message WHERE content IS NULL OR content = '') as empty_messages,
+            (SELECT COUNT(*) FROM direct_message WHERE dm_key NOT LIKE '%::%') as invalid_dm_keys
+    """
+        )
     )
-    empty_usernames = result.scalar()
+    empty_usernames, empty_messages, invalid_dm_keys = result.fetchone()
 
     if empty_usernames > 0:
         print(f"  FAIL: {empty_usernames} users with empty usernames")
     else:
         print("  PASS: All users have valid usernames")
 
-    # Check for empty message content
-    result = conn.execute(
-        text("SELECT COUNT(*) FROM message WHERE content IS NULL OR content = ''")
-    )
-    empty_messages = result.scalar()
-
     if empty_messages > 0:
         print(f"  FAIL: {empty_messages} messages with empty content")
     else:
         print("  PASS: All messages have content")
 
-    # Check DM key format
-    result = conn.execute(
-        text("SELECT dm_key FROM direct_message WHERE dm_key NOT LIKE '%::%'")
-    )
-    invalid_dm_keys = result.fetchall()
-
-    if invalid_dm_keys:
-        print(f"  FAIL: {len(invalid_dm_keys)} DM keys with invalid format")
+    if invalid_dm_keys > 0:
+        print(f"  FAIL: {invalid_dm_keys} DM keys with invalid format")
     else:
         print("  PASS: All DM keys have correct format")
 
@@ -289,7 +291,7 @@ def run_constraint_verification(conn):
 def main():
     """Main verification function."""
     database_url = get_database_url()
-    engine = create_engine(database_url)
+    engine = create_database_engine(database_url)
 
     with engine.connect() as conn:
         print_header()
@@ -6,6 +6,7 @@ import pytest
 
 from app.models.chat import DirectMessage, GroupChat
 from app.models.membership import MemberRole
+from app.repositories import MemberRow
 
 
 class TestChatRepo:
@@ -146,6 +147,20 @@ class TestChatRepo:
 
         assert chats == []
 
+    def test_get_user_chat_summaries(
+        self, chat_repo, sample_dm, sample_group_chat, sample_users
+    ):
+        """Test retrieving (id, type, created_at) of a user's chats."""
+        alice = sample_users[0]
+
+        summaries = chat_repo.get_user_chat_summaries(alice.id)
+
+        types_by_id = {chat_id: chat_type for chat_id, chat_type, _ in summaries}
+        assert types_by_id[sample_dm.id] == "dm"
+        assert types_by_id[sample_group_chat.id] == "group"
+        created = [created_at for _, _, created_at in summaries]
+        assert created == sorted(created, reverse=True)
+
     def test_add_member_new(self, chat_repo, sample_group_chat, user_repo, clean_db):
         """Test adding a new member to a chat."""
         # Create a real user first
@@ -225,6 +240,20 @@ class TestChatRepo:
 
         assert is_member is False
 
+    def test_is_member_of(self, chat_repo, sample_dm, sample_group_chat, sample_users):
+        """Test is_member_of returns only the chats the user belongs to."""
+        charlie = sample_users[2]  # In the group, not in the DM
+        unknown_chat_id = uuid4()
+
+        chat_ids = [sample_dm.id, sample_group_chat.id, unknown_chat_id]
+        result = chat_repo.is_member_of(chat_ids, charlie.id)
+
+        assert result == {sample_group_chat.id}
+
+    def test_is_member_of_empty(self, chat_repo, sample_users, clean_db):
+        """Test is_member_of with no chat IDs returns an empty set."""
+        assert chat_repo.is_member_of([], sample_users[0].id) == set()
+
     def test_get_chat_by_id(self, chat_repo, sample_dm):
         """Test retrieving chat by ID."""
         chat = chat_repo.get_chat_by_id(sample_dm.id)
@@ -241,6 +270,18 @@ class TestChatRepo:
 
         assert chat is None
 
+    def test_is_group_chat(self, chat_repo, sample_group_chat, sample_dm):
+        """Test group chat check distinguishes chat kinds."""
+        assert chat_repo.is_group_chat(sample_group_chat.id) is True
+        assert chat_repo.is_group_chat(sample_dm.id) is False
+        assert chat_repo.is_group_chat(uuid4()) is False
+
+    def test_is_direct_message(self, chat_repo, sample_group_chat, sample_dm):
+        """Test direct message check distinguishes chat kinds."""
+        assert chat_repo.is_direct_message(sample_dm.id) is True
+        assert chat_repo.is_direct_message(sample_group_chat.id) is False
+        assert chat_repo.is_direct_message(uuid4()) is False
+
     def test_get_chat_members(self, chat_repo, sample_group_chat, sample_users):
         """Test retrieving all members of a chat."""
         members = chat_repo.get_chat_members(sample_group_chat.id)
@@ -256,6 +297,68 @@ class TestChatRepo:
         alice_membership = next(m for m in members if m.user_id == sample_users[0].id)
         assert alice_membership.role == MemberRole.ADMIN
 
+    def test_get_member_roles(self, chat_repo, sample_group_chat, sample_users):
+        """Test member role map contains every member with their role."""
+        alice, bob, charlie = sample_users
+
+        roles = chat_repo.get_member_roles(sample_group_chat.id)
+
+        assert roles == {
+            alice.id: MemberRole.ADMIN,
+            bob.id: MemberRole.MEMBER,
+            charlie.id: MemberRole.MEMBER,
+        }
+
+    def test_get_member_roles_unknown_chat(self, chat_repo, clean_db):
+        """Test member role map is empty for a chat with no members."""
+        assert chat_repo.get_member_roles(uuid4()) == {}
+
+    def test_get_roles_for_users(self, chat_repo, sample_group_chat, sample_users):
+        """Test roles are returned only for the requested members."""
+        alice, bob = sample_users[0], sample_users[1]
+        non_member_id = uuid4()
+
+        roles = chat_repo.get_roles_for_users(
+            sample_group_chat.id, [alice.id, bob.id, non_member_id]
+        )
+
+        assert roles == {alice.id: MemberRole.ADMIN, bob.id: MemberRole.MEMBER}
+
+    def test_count_admins(self, chat_repo, sample_group_chat, sample_users):
+        """Test admin count reflects role changes."""
+        bob = sample_users[1]
+
+        assert chat_repo.count_admins(sample_group_chat.id) == 1
+
+        chat_repo.add_member(sample_group_chat.id, bob.id, MemberRole.ADMIN)
+
+        assert chat_repo.count_admins(sample_group_chat.id) == 2
+
+    def test_count_admins_dm(self, chat_repo, sample_dm):
+        """Test direct messages have no admins."""
+        assert chat_repo.count_admins(sample_dm.id) == 0
+
+    def test_get_first_admin_user_id(self, chat_repo, sample_group_chat, sample_users):
+        """Test the admin's user ID is returned."""
+        alice = sample_users[0]  # Admin of the group
+
+        assert chat_repo.get_first_admin_user_id(sample_group_chat.id) == alice.id
+
+    def test_get_first_admin_user_id_none(self, chat_repo, sample_dm):
+        """Test chats without admins return None."""
+        assert chat_repo.get_first_admin_user_id(sample_dm.id) is None
+
+    def test_list_member_rows(self, chat_repo, sample_group_chat, sample_users):
+        """Test member rows match the ORM membership listing."""
+        members = chat_repo.get_chat_members(sample_group_chat.id)
+
+        rows = chat_repo.list_member_rows(sample_group_chat.id)
+
+        assert {(r.user_id, r.role) for r in rows} == {
+            (m.user_id, m.role) for m in members
+        }
+        assert all(isinstance(r, MemberRow) for r in rows)
+
     def test_create_dm_coordinated_mode(
         self, chat_repo, test_session, sample_users, clean_db
     ):
@@ -98,6 +98,22 @@ class TestForeignKeyViolations:
 
         assert "foreign key constraint" in str(exc_info.value).lower()
 
+    def test_create_dm_nonexistent_user(self, chat_repo, sample_users, clean_db):
+        """Test creating DM with non-existent user."""
+        alice = sample_users[0]
+
+        with pytest.raises(ValueError, match="One or more users do not exist"):
+            chat_repo.create_direct_message(alice.id, uuid4())
+
+    def test_create_group_chat_nonexistent_member(
+        self, chat_repo, sample_users, clean_db
+    ):
+        """Test creating group chat with a non-existent member."""
+        alice = sample_users[0]
+
+        with pytest.raises(ValueError, match="One or more users do not exist"):
+            chat_repo.create_group_chat(alice.id, "Ghost Group", [uuid4()])
+
 
 class TestBoundaryConditions:
     """Test boundary conditions and extreme values."""
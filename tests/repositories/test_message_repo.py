@@ -57,6 +57,34 @@ class TestMessageRepo:
         assert message1.id == message2.id
         assert message2.content == "First message"  # Original content preserved
 
+    def test_bulk_create(self, message_repo, sample_dm, sample_users, clean_db):
+        """Test bulk insertion of messages from row dicts."""
+        alice, bob = sample_users[0], sample_users[1]
+        rows = [
+            {
+                "chat_id": sample_dm.id,
+                "sender_id": sender.id,
+                "content": f"Bulk message {i}",
+                "idempotency_key": f"bulk_key_{i}",
+            }
+            for i, sender in enumerate([alice, bob, alice])
+        ]
+
+        message_repo.bulk_create(rows)
+
+        history = message_repo.get_chat_history(sample_dm.id)
+        assert sorted(m.idempotency_key for m in history) == [
+            "bulk_key_0",
+            "bulk_key_1",
+            "bulk_key_2",
+        ]
+
+    def test_bulk_create_empty(self, message_repo, sample_dm, clean_db):
+        """Test bulk insertion with no rows is a no-op."""
+        message_repo.bulk_create([])
+
+        assert message_repo.get_chat_history(sample_dm.id) == []
+
     def test_get_by_idempotency_key(self, message_repo, sample_messages):
         """Test retrieving message by idempotency key."""
         original_message = sample_messages[0]
@@ -128,6 +156,20 @@ class TestMessageRepo:
         for message in messages:
             assert message.created_at > after_timestamp
 
+    def test_stream_chat_history(self, message_repo, sample_messages):
+        """Test streaming yields the same ordered history across batches."""
+        chat_id = sample_messages[0].chat_id
+
+        streamed = list(message_repo.stream_chat_history(chat_id, batch_size=2))
+        expected = message_repo.get_chat_history(chat_id, limit=100)
+
+        assert [m.id for m in streamed] == [m.id for m in expected]
+
+    def test_stream_chat_history_invalid_batch_size(self, message_repo, clean_db):
+        """Test that a non-positive batch size is rejected."""
+        with pytest.raises(ValueError, match="Batch size must be positive"):
+            message_repo.stream_chat_history(uuid4(), batch_size=0)
+
     def test_get_chat_history_empty_chat(self, message_repo, sample_dm, clean_db):
         """Test getting history from chat with no messages."""
         messages = message_repo.get_chat_history(sample_dm.id)
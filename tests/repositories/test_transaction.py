@@ -1,10 +1,10 @@
 """Tests for transaction context manager."""
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 from sqlalchemy.exc import IntegrityError
 
-from app.repositories.transaction import transaction_scope
+from app.repositories.transaction import savepoint_scope, transaction_scope
 
 
 class TestTransactionScope:
@@ -155,3 +155,35 @@ class TestTransactionScope:
             assert session is mock_session
 
         factory.assert_called_once()
+
+
+class TestSavepointScope:
+    """Test cases for savepoint_scope context manager."""
+
+    def test_savepoint_scope_uses_nested_transaction(self):
+        """Test that savepoint_scope wraps the block in begin_nested."""
+        mock_session = MagicMock()
+
+        with savepoint_scope(mock_session) as session:
+            assert session is mock_session
+
+        mock_session.begin_nested.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    def test_savepoint_rollback_keeps_outer_work(
+        self, user_repo, sample_users, test_session_factory, clean_db
+    ):
+        """Test that a failed savepoint only rolls back its own step."""
+        alice = sample_users[0]
+
+        with transaction_scope(test_session_factory) as session:
+            user_repo.create_user("savepoint_user", "hash123", session=session)
+
+            with pytest.raises(IntegrityError):
+                with savepoint_scope(session):
+                    # Duplicate username violates the unique constraint
+                    user_repo.create_user(alice.username, "hash456", session=session)
+
+        # Work done before the failed savepoint is still committed
+        persisted_user = user_repo.get_by_username("savepoint_user")
+        assert persisted_user is not None
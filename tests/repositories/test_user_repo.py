@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 from app.models.user import User, UserStatus
@@ -53,6 +54,27 @@ class TestUserRepo:
 
         assert user is None
 
+    def test_get_by_id_reuses_session_identity(
+        self, user_repo, sample_user, test_session, test_engine
+    ):
+        """Test a repeated lookup in one session is served without SQL."""
+        first = user_repo.get_user_by_id(sample_user.id, session=test_session)
+
+        statements = []
+
+        def record_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", record_statement)
+        try:
+            second = user_repo.get_user_by_id(sample_user.id, session=test_session)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", record_statement)
+
+        assert first is not None
+        assert first is second
+        assert statements == []
+
     def test_get_by_username_existing(self, user_repo, sample_user):
         """Test retrieving existing user by username."""
         user = user_repo.get_by_username(sample_user.username)